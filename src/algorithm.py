@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import abstractmethod
+from collections import deque
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -13,6 +14,12 @@ class BuildAlgorithm:
 
     def __init__(self, wall: Wall) -> None:
         self.wall = wall
+        self.total_courses = len(wall.courses)
+
+    @property
+    def placed_count(self) -> int:
+        """Number of bricks placed in the wall."""
+        return self.wall.placed_count
 
     @abstractmethod
     def next_brick(self) -> Brick | None:
@@ -26,6 +33,29 @@ class BuildAlgorithm:
     def statistics(self) -> dict[str, int]:
         raise NotImplementedError
 
+    def _topological_order(self) -> list[Brick]:
+        """
+        Order all bricks so that every brick comes after its supports
+        (Kahn's algorithm over the support -> load relations).
+        """
+        in_degree = {}
+        queue = deque()
+        for course in self.wall.courses:
+            for brick in course:
+                in_degree[brick] = len(brick.supports)
+                if not brick.supports:
+                    queue.append(brick)
+
+        order = []
+        while queue:
+            brick = queue.popleft()
+            order.append(brick)
+            for load in brick.loads:
+                in_degree[load] -= 1
+                if in_degree[load] == 0:
+                    queue.append(load)
+        return order
+
     def place_next_brick(self) -> bool:
         """Place the next brick in the build sequence, if available."""
         brick = self.next_brick()
@@ -33,3 +63,10 @@ class BuildAlgorithm:
             return False
         brick.place()
         return True
+
+    def place_next_n(self, n: int) -> int:
+        """Place up to n bricks in the build sequence, returns the number placed."""
+        placed = 0
+        while placed < n and self.place_next_brick():
+            placed += 1
+        return placed
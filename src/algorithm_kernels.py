@@ -0,0 +1,35 @@
+"""
+Compiled inner loops of the build algorithms.
+
+Bricks are referred to by their index in the wall's flat brick arrays (see
+Wall.index_bricks).
+"""
+
+from numba import njit
+
+
+@njit(cache=True)
+def first_unplaced(order, placed, start):
+    """Return the first position >= start in order whose brick is not placed."""
+    i = start
+    while i < len(order) and placed[order[i]]:
+        i += 1
+    return i
+
+
+@njit(cache=True)
+def next_candidate(order, placed, pending, x_start, x_end, start, xmin, xmax):
+    """
+    Return the first position >= start in order whose brick is unplaced, has
+    all its supports placed and lies within [xmin, xmax], or -1 if none does.
+    """
+    for i in range(start, len(order)):
+        b = order[i]
+        if (
+            not placed[b]
+            and pending[b] == 0
+            and x_start[b] >= xmin
+            and x_end[b] <= xmax
+        ):
+            return i
+    return -1
@@ -18,46 +18,40 @@ class BrickByBrick(BuildAlgorithm):
 
     def __init__(self, wall):
         super().__init__(wall)
-        self.current_course = 0
         self.sections = len(wall.courses)
+        self._order = self._topological_order()
+        self._idx = 0
 
     def next_brick(self) -> Brick | None:
-
-        while self.current_course < self.sections:
-            wall_subset = self.wall.courses[
-                self.current_course : self.current_course + 1
-            ]
-
-            for course in reversed(wall_subset):
-                for brick in course:
-                    if self.brick_condition(brick):
-                        return brick
-
-            self.current_course += 1
+        while self._idx < len(self._order):
+            brick = self._order[self._idx]
+            if self.brick_condition(brick):
+                return brick
+            self._idx += 1
         return None
 
+    def place_next_n(self, n: int) -> int:
+        """Place up to n bricks by walking the precomputed order directly."""
+        placed = 0
+        while placed < n and self._idx < len(self._order):
+            brick = self._order[self._idx]
+            self._idx += 1
+            if brick.placed:
+                continue
+            brick.place()
+            placed += 1
+        return placed
+
     def brick_condition(self, brick: Brick) -> bool:
         """
-        Check if the brick is allowed to be placed:
-        - Brick is within the build envelope.
-        - Brick supports are place or is on the ground.
+        Check if the brick is allowed to be placed. Supports are guaranteed
+        to be placed by the topological order, so only the state is checked.
         """
-        if brick.placed:
-            return False
-
-        if brick.row == 0:
-            return True
-
-        return all(support.placed for support in brick.supports)
+        return not brick.placed
 
     def statistics(self) -> dict[str, int]:
-        bricks = [b for course in self.wall.courses for b in course if b.placed]
-        total_bricks = len(bricks)
-        total_courses = len(self.wall.courses)
-        total_brick_length = sum(b.length for b in bricks)
-
         return {
-            "total_bricks": total_bricks,
-            "total_brick_length": total_brick_length,
-            "total_courses": total_courses,
+            "total_bricks": self.wall.placed_count,
+            "total_brick_length": self.wall.placed_length,
+            "total_courses": self.total_courses,
         }
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 from enum import Enum
-from math import ceil
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from algorithm import BuildAlgorithm
+from algorithm_kernels import first_unplaced, next_candidate
 from config import (
     BED_JOINT_HEIGHT,
     BRICK_HEIGHT,
@@ -35,50 +37,102 @@ class LimitedCourseStride(BuildAlgorithm):
         self.build_envelope = build_envelope  # (horizontal_width, vertical_height)
         self.direction = Direction.L2R
 
-        self.sections = ceil(len(wall.courses) / max_courses)
+        self.sections = (len(wall.courses) + max_courses - 1) // max_courses
         self.current_section = 0
         self.current_stride = 0
         self.platform_moves = 0
 
         self.current_stride_x_min = 0
         self.current_stride_y_min = 0
+        # Horizontal bounds of the current window, kept in sync by _move_window
+        self._cached_xmin = 0
+        self._cached_xmax = self.build_envelope[0]
+
+        # Height the robot must reach to build each section completely
+        self._section_height = max_courses * (BRICK_HEIGHT + BED_JOINT_HEIGHT)
+        self._section_required_heights = [
+            min((section + 1) * self._section_height, wall.height)
+            for section in range(self.sections)
+        ]
+
+        self._candidates = self._build_candidate_orders()
+        # Highest course of every section, decides when a section is finished
+        n_courses = len(wall.courses)
+        self._section_top_courses = [
+            wall.courses[min((section + 1) * max_courses, n_courses) - 1]
+            for section in range(self.sections)
+        ]
+        self._cursor_key = None
+        self._cursor = 0
+
+    def _build_candidate_orders(self) -> dict[tuple[int, Direction], np.ndarray]:
+        """
+        Precompute the brick order for every (section, direction) pair, as
+        indices into the wall's brick arrays.
 
-    def _get_current_wall_subset(self) -> list[Course]:
-        return self.wall.courses[
-            self.current_section
-            * self.max_courses : (self.current_section + 1)
-            * self.max_courses
-        ][::-1]
-
-    def get_directional_course(self, course: Course) -> Course:
-        if self.direction == Direction.L2R:
-            return course
-        else:
-            return list(reversed(course))
+        Bricks are sorted by course (lowest first), then by the length of the
+        longest chain of bricks they (indirectly) carry, so bricks that unblock
+        the most future work come first, then by position in the direction of
+        travel.
+        """
+        depth = {}
+        for brick in reversed(self._topological_order()):
+            depth[brick] = 1 + max((depth[load] for load in brick.loads), default=0)
+
+        candidates = {}
+        for section in range(self.sections):
+            courses = self.wall.courses[
+                section * self.max_courses : (section + 1) * self.max_courses
+            ]
+            bricks = [brick for course in courses for brick in course]
+            l2r = sorted(bricks, key=lambda b: (b.row, -depth[b], b.x_start))
+            r2l = sorted(bricks, key=lambda b: (b.row, -depth[b], -b.x_start))
+            for direction, ordered in ((Direction.L2R, l2r), (Direction.R2L, r2l)):
+                candidates[(section, direction)] = np.fromiter(
+                    (self.wall.brick_idx[b] for b in ordered), np.intp, len(ordered)
+                )
+        return candidates
 
     def next_brick(self) -> Brick | None:
         """
-        Return the next unplaced brick in the current section that satisfies
-        brick_condition. If none found in the section, advance to the next
-        section and continue. Returns None when all sections are exhausted.
+        Return the next unplaced brick in the current section that lies within
+        the build envelope and has all its supports placed. If none found in
+        the section, advance to the next section and continue. Returns None
+        when all sections are exhausted.
         """
         while self.current_section < self.sections:
-            # courses in this section (already reversed in helper)
-            wall_subset = self._get_current_wall_subset()
-
-            # Iterate from lowest to highest (or keep original ordering if desired)
-            for course in reversed(wall_subset):
-                for brick in self.get_directional_course(course):
-                    if self.brick_condition(brick):
-                        brick.stride_index = self.current_stride
-                        return brick
-
-            if all(brick.placed for brick in wall_subset[0]):
+            wall = self.wall
+            key = (self.current_section, self.direction)
+            order = self._candidates[key]
+            if key != self._cursor_key:
+                self._cursor_key = key
+                self._cursor = 0
+
+            # Skip the prefix of bricks that have already been placed
+            self._cursor = first_unplaced(order, wall.placed_arr, self._cursor)
+
+            i = next_candidate(
+                order,
+                wall.placed_arr,
+                wall.pending,
+                wall.x_start_arr,
+                wall.x_end_arr,
+                self._cursor,
+                self._cached_xmin,
+                self._cached_xmax,
+            )
+            if i >= 0:
+                brick = wall.bricks[order[i]]
+                brick.stride_index = self.current_stride
+                return brick
+
+            top_course = self._section_top_courses[self.current_section]
+            if top_course.all_placed:
                 if self.step_vertically():
                     continue
                 return None
             else:
-                if not self.step_horizontally(wall_subset[0]):
+                if not self.step_horizontally(top_course):
                     return None
         return None
 
@@ -114,28 +168,21 @@ class LimitedCourseStride(BuildAlgorithm):
         self.current_section += 1
         if self.current_section >= self.sections:
             return False
-        course_height = BRICK_HEIGHT + BED_JOINT_HEIGHT
-
-        # Lowest course index in the new section
-        section_height = self.max_courses * course_height
-
         reachable_height = self.current_stride_y_min + self.build_envelope[1]
-        required_height = min(
-            (self.current_section + 1) * section_height, self.wall.height
-        )
+        required_height = self._section_required_heights[self.current_section]
 
         if required_height > reachable_height:
-            self.current_stride_y_min += required_height - section_height
+            self.current_stride_y_min += required_height - self._section_height
             self.platform_moves += 1
 
         # Toggle direction & reset horizontal position to the appropriate edge
         if self.direction == Direction.R2L:
             self.direction = Direction.L2R
-            self.current_stride_x_min = 0
+            self._move_window(0)
         else:  # L2R -> R2L
             self.direction = Direction.R2L
             horizontal_width = self.build_envelope[0]
-            self.current_stride_x_min = max(0, self.wall.width - horizontal_width)
+            self._move_window(max(0, self.wall.width - horizontal_width))
         return True
 
     def step_horizontally(self, top_course: Course) -> bool:
@@ -151,8 +198,7 @@ class LimitedCourseStride(BuildAlgorithm):
         - brick.x_start < brick.x_end.
         - build_envelope width may be larger than wall width (clamped to 0 origin).
         """
-        placed = [b for b in top_course if b.placed]
-        if not placed:
+        if not top_course.any_placed:
             return False
 
         envelope_width = self.build_envelope[0]
@@ -160,55 +206,36 @@ class LimitedCourseStride(BuildAlgorithm):
         max_left_origin = max(0, self.wall.width - envelope_width)
 
         if self.direction == Direction.L2R:
-            candidate = max(b.x_end for b in placed) + HEAD_JOINT_LENGTH
+            candidate = top_course.max_placed_x_end + HEAD_JOINT_LENGTH
             new_x_min = min(max_left_origin, max(0, candidate))
         else:  # R2L
-            right_edge_target = min(b.x_start for b in placed) - HEAD_JOINT_LENGTH
+            right_edge_target = top_course.min_placed_x_start - HEAD_JOINT_LENGTH
             new_x_min = right_edge_target - envelope_width
             new_x_min = max(0, new_x_min)
             new_x_min = min(new_x_min, max_left_origin)
 
         if new_x_min != self.current_stride_x_min:
-            self.current_stride_x_min = new_x_min
+            self._move_window(new_x_min)
             self.current_stride += 1
 
         return True
 
-    def brick_condition(self, brick: Brick) -> bool:
-        """
-        Check if the brick is allowed to be placed:
-        - Brick is within the build envelope.
-        - Brick supports are place or is on the ground.
-        """
-        if brick.placed:
-            return False
-
-        x_max = self.current_stride_x_min + self.build_envelope[0]
-        if not (self.current_stride_x_min <= brick.x_start < x_max):
-            return False
-
-        if not (self.current_stride_x_min < brick.x_end <= x_max):
-            return False
-
-        if brick.row == 0:
-            return True
-
-        return all(support.placed for support in brick.supports)
+    def _move_window(self, x_min: int) -> None:
+        """Move the horizontal build envelope window to start at x_min."""
+        self.current_stride_x_min = x_min
+        self._cached_xmin = x_min
+        self._cached_xmax = x_min + self.build_envelope[0]
 
     def statistics(self) -> dict[str, int]:
         strides = self.current_stride + 1
-
-        bricks = [b for course in self.wall.courses for b in course if b.placed]
-        total_bricks = len(bricks)
+        total_bricks = self.wall.placed_count
         average_bricks_per_stride = total_bricks / (strides) if strides > 0 else 0
-        total_courses = len(self.wall.courses)
-        total_brick_length = sum(b.length for b in bricks)
 
         return {
             "total_robot_moves": strides - 1,
             "total_platform_moves": self.platform_moves,
             "average_bricks_per_stride": average_bricks_per_stride,
             "total_bricks": total_bricks,
-            "total_brick_length": total_brick_length,
-            "total_courses": total_courses,
+            "total_brick_length": self.wall.placed_length,
+            "total_courses": self.total_courses,
         }
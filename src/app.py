@@ -1,8 +1,19 @@
 from __future__ import annotations
 
+import sys
+from bisect import bisect_left
 from typing import TYPE_CHECKING
 
-from PyQt6.QtCore import QRectF, Qt
+from loguru import logger
+from PyQt6.QtCore import (
+    QObject,
+    QRectF,
+    QRunnable,
+    Qt,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
+)
 from PyQt6.QtGui import QBrush, QColor, QFont, QPainter, QPen
 from PyQt6.QtWidgets import (
     QApplication,
@@ -13,6 +24,8 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QMainWindow,
+    QMessageBox,
+    QProgressDialog,
     QPushButton,
     QSpinBox,
     QSplitter,
@@ -24,10 +37,14 @@ from PyQt6.QtWidgets import (
 
 from algos import BrickByBrick, LimitedCourseStride
 from bonds import FlemishBond, StretcherBond, WildBond
+from config import BED_JOINT_HEIGHT, BRICK_HEIGHT
 from wall import Wall
 
 if TYPE_CHECKING:
     from algorithm import BuildAlgorithm
+    from brick import Brick
+
+COURSE_HEIGHT = BRICK_HEIGHT + BED_JOINT_HEIGHT
 
 # Disclaimer: This GUI is mostly `vibe` coded and adjusted for usability.
 # I had implemented a pure terminal interface first, but it was annoying me
@@ -94,6 +111,43 @@ class WallSelectionDialog(QDialog):
         return width, height, bond_class, algo_class
 
 
+# --- Wall Construction --- #
+class WallBuildSignals(QObject):
+    """Signals emitted by a WallBuildTask"""
+
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+
+class WallBuildTask(QRunnable):
+    """
+    Generates the bond design and support relations of a wall, and sets up the
+    build algorithm (placement orders etc.) off the GUI thread
+    """
+
+    def __init__(self, wall: Wall, algo_class: type[BuildAlgorithm]):
+        super().__init__()
+        self.wall = wall
+        self.algo_class = algo_class
+        self.signals = WallBuildSignals()
+
+    def run(self):
+        # Exceptions raised in a pool thread are not propagated, so every
+        # failure is reported through the failed signal
+        try:
+            if isinstance(self.wall.bond, WildBond):
+                self.wall.bond.prepare_solution(self.wall)
+            self.wall.generate_bond_design()
+            self.wall.assign_support_relations()
+            self.wall.validate_support_relations()
+            algorithm = self.algo_class(self.wall)
+        except Exception as e:  # noqa: BLE001
+            logger.exception("Building the wall failed")
+            self.signals.failed.emit(str(e) or type(e).__name__)
+            return
+        self.signals.finished.emit(algorithm)
+
+
 # --- Wall Canvas --- #
 class WallCanvas(QWidget):
     """Custom widget for rendering the brick wall"""
@@ -105,7 +159,7 @@ class WallCanvas(QWidget):
         self.setMinimumSize(800, 600)
 
         # Stride colors
-        self.stride_colors = [
+        self.stride_colors = (
             QColor(255, 107, 107),
             QColor(78, 205, 196),
             QColor(69, 183, 209),
@@ -120,97 +174,226 @@ class WallCanvas(QWidget):
             QColor(53, 92, 125),
             QColor(20, 90, 50),
             QColor(105, 105, 105),
-        ]
-
-    def paintEvent(self, event):
-        """Draw the wall"""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-        from config import BED_JOINT_HEIGHT, BRICK_HEIGHT
-
-        brick_height_mm = BRICK_HEIGHT
-        joint_height_mm = BED_JOINT_HEIGHT
-        course_height_mm = brick_height_mm + joint_height_mm
-
+        )
+        # Brushes per stride index, filled lazily by _stride_brush()
+        self._stride_brushes: dict[int, QBrush] = {}
+        self._placed_pen = QPen(QColor(0, 0, 0), 1)
+        self._empty_pen = QPen(QColor(180, 180, 180), 1)
+        self._empty_brush = QBrush(QColor(255, 255, 255))
+
+        # Canvas rectangles of all bricks (course-major), rebuilt on resize
+        self._bricks_flat: list[Brick] = []
+        self._brick_rects: list[QRectF] = []
+        self._rect_of: dict[Brick, QRectF] = {}
+        self._update_layout()
+
+        # Bricks placed since the last repaint request, see update_placed()
+        self._dirty_bricks: list[Brick] = []
+        self._painted_envelope: QRectF | None = None
+        wall.on_brick_placed = self._dirty_bricks.append
+
+        # Coalesces repaint requests to at most one per frame (~60 fps)
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(16)
+        self._repaint_timer.timeout.connect(self.update_placed)
+
+    def _stride_brush(self, stride_index: int) -> QBrush:
+        """Create and cache the fill brush for a stride index."""
+        brush = QBrush(self.stride_colors[stride_index % len(self.stride_colors)])
+        self._stride_brushes[stride_index] = brush
+        return brush
+
+    def _update_layout(self) -> None:
+        """Compute the mm -> pixel transform for the current widget size."""
         padding = 20
         available_width = self.width() - 2 * padding
         available_height = self.height() - 2 * padding
 
         scale_x = available_width / self.wall.width
         scale_y = available_height / self.wall.height
-        scale = min(scale_x, scale_y)
-
-        scaled_width = self.wall.width * scale
-        scaled_height = self.wall.height * scale
-        offset_x = (self.width() - scaled_width) / 2
-        offset_y = (self.height() - scaled_height) / 2
-
-        painter.fillRect(self.rect(), QColor(245, 245, 245))
-
+        self._scale = min(scale_x, scale_y)
+
+        self._scaled_width = self.wall.width * self._scale
+        self._scaled_height = self.wall.height * self._scale
+        self._offset_x = (self.width() - self._scaled_width) / 2
+        self._offset_y = (self.height() - self._scaled_height) / 2
+        self._recompute_rects()
+
+    def resizeEvent(self, event):
+        self._update_layout()
+        super().resizeEvent(event)
+
+    def _recompute_rects(self) -> None:
+        """Transform every brick to its canvas rectangle once per layout."""
+        scale = self._scale
+        offset_x = self._offset_x
+        height = BRICK_HEIGHT * scale
+        self._bricks_flat = []
+        self._brick_rects = []
         for course_idx, course in enumerate(self.wall.courses):
-            y_bottom = course_idx * course_height_mm
+            y_bottom = course_idx * COURSE_HEIGHT
+            y1 = self._offset_y + (self.wall.height - y_bottom - BRICK_HEIGHT) * scale
             for brick in course:
                 if brick.x_start is None or brick.x_end is None:
                     continue
+                self._bricks_flat.append(brick)
+                self._brick_rects.append(
+                    QRectF(
+                        offset_x + brick.x_start * scale,
+                        y1,
+                        (brick.x_end - brick.x_start) * scale,
+                        height,
+                    )
+                )
+        self._rect_of = dict(zip(self._bricks_flat, self._brick_rects))
+
+    def _envelope_rect(self) -> QRectF | None:
+        """Return the canvas rectangle of the robot's stride, if any."""
+        if not (
+            hasattr(self.algorithm, "build_envelope")
+            and hasattr(self.algorithm, "current_stride_x_min")
+        ):
+            return None
+        envelope_width, envelope_height = self.algorithm.build_envelope
+        x_min = self.algorithm.current_stride_x_min
+        y_min = self.algorithm.current_stride_y_min
+
+        # Scale the envelope dimensions and position
+        scaled_envelope_width = envelope_width * self._scale
+        scaled_envelope_height = envelope_height * self._scale
+        scaled_x_min = x_min * self._scale
+        scaled_y_min = y_min * self._scale
+
+        # Calculate the rectangle coordinates in canvas space
+        rect_x = self._offset_x + scaled_x_min
+        rect_y = self._offset_y + (
+            self._scaled_height - scaled_y_min - scaled_envelope_height
+        )
+        return QRectF(rect_x, rect_y, scaled_envelope_width, scaled_envelope_height)
+
+    def _bricks_in(self, rect: QRectF):
+        """Yield the bricks whose canvas rectangle may intersect rect."""
+        courses = self.wall.courses
+        if not courses:
+            return
+        # Canvas y grows downwards, wall y grows upwards from the ground
+        y_top_mm = self.wall.height - (rect.top() - self._offset_y) / self._scale
+        y_bottom_mm = self.wall.height - (rect.bottom() - self._offset_y) / self._scale
+        first = max(0, int(y_bottom_mm // COURSE_HEIGHT))
+        last = min(len(courses) - 1, int(y_top_mm // COURSE_HEIGHT))
+
+        x_min_mm = (rect.left() - self._offset_x) / self._scale
+        x_max_mm = (rect.right() - self._offset_x) / self._scale
+        for course in courses[first : last + 1]:
+            i = bisect_left(course, x_min_mm, key=lambda b: b.x_end)
+            while i < len(course) and course[i].x_start <= x_max_mm:
+                yield course[i]
+                i += 1
+
+    def schedule_update(self) -> None:
+        """Request a repaint of the placed bricks within the next frame."""
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start()
+
+    def update_placed(self) -> None:
+        """
+        Schedule a repaint of only the area touched by the bricks placed since
+        the last call, and of the build envelope if it moved.
+        """
+        dirty = QRectF()
+        for brick in self._dirty_bricks:
+            dirty = dirty.united(self._rect_of[brick])
+        self._dirty_bricks.clear()
+
+        envelope = self._envelope_rect()
+        if envelope != self._painted_envelope:
+            for rect in (envelope, self._painted_envelope):
+                if rect is not None:
+                    dirty = dirty.united(rect)
 
-                x1 = offset_x + brick.x_start * scale
-                y1 = offset_y + (self.wall.height - y_bottom - brick_height_mm) * scale
-                width = (brick.x_end - brick.x_start) * scale
-                height = brick_height_mm * scale
+        if not dirty.isNull():
+            # Margin for antialiased pens drawn on the rectangle edges
+            self.update(dirty.adjusted(-2, -2, 2, 2).toAlignedRect())
 
-                if brick.placed:
-                    color = self.stride_colors[
-                        brick.stride_index % len(self.stride_colors)
-                    ]
-                    pen = QPen(QColor(0, 0, 0), 1)
-                else:
-                    color = QColor(255, 255, 255)
-                    pen = QPen(QColor(180, 180, 180), 1)
+    def paintEvent(self, event):
+        """Draw the wall, limited to the region that needs repainting"""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-                painter.setPen(pen)
-                painter.setBrush(QBrush(color))
-                painter.drawRect(QRectF(x1, y1, width, height))
+        region = event.rect()
+        painter.fillRect(region, QColor(245, 245, 245))
+
+        if region.contains(self.rect()):
+            bricks_and_rects = zip(self._bricks_flat, self._brick_rects)
+        else:
+            # Include neighbours whose antialiased outline bleeds into the region
+            bricks = self._bricks_in(QRectF(region).adjusted(-1, -1, 1, 1))
+            bricks_and_rects = ((brick, self._rect_of[brick]) for brick in bricks)
+
+        for brick, rect in bricks_and_rects:
+            if brick.placed:
+                brush = self._stride_brushes.get(brick.stride_index)
+                if brush is None:
+                    brush = self._stride_brush(brick.stride_index)
+                painter.setPen(self._placed_pen)
+            else:
+                brush = self._empty_brush
+                painter.setPen(self._empty_pen)
+
+            painter.setBrush(brush)
+            painter.drawRect(rect)
 
         # Draw border
         painter.setPen(QPen(QColor(0, 0, 0), 2))
         painter.setBrush(Qt.BrushStyle.NoBrush)
-        painter.drawRect(QRectF(offset_x, offset_y, scaled_width, scaled_height))
+        painter.drawRect(
+            QRectF(
+                self._offset_x,
+                self._offset_y,
+                self._scaled_width,
+                self._scaled_height,
+            )
+        )
 
         # Draw the robot's stride (build envelope)
-        if hasattr(self.algorithm, "build_envelope") and hasattr(
-            self.algorithm, "current_stride_x_min"
-        ):
-            envelope_width, envelope_height = self.algorithm.build_envelope
-            x_min = self.algorithm.current_stride_x_min
-            y_min = self.algorithm.current_stride_y_min
-
-            # Scale the envelope dimensions and position
-            scaled_envelope_width = envelope_width * scale
-            scaled_envelope_height = envelope_height * scale
-            scaled_x_min = x_min * scale
-            scaled_y_min = y_min * scale
-
-            # Calculate the rectangle coordinates in canvas space
-            rect_x = offset_x + scaled_x_min
-            rect_y = offset_y + (scaled_height - scaled_y_min - scaled_envelope_height)
-
-            # Draw the rectangle
+        envelope = self._envelope_rect()
+        self._painted_envelope = envelope
+        if envelope is not None:
             pen = QPen(QColor(255, 0, 0), 2, Qt.PenStyle.DashLine)
             painter.setPen(pen)
             painter.setBrush(Qt.BrushStyle.NoBrush)
-            painter.drawRect(
-                QRectF(rect_x, rect_y, scaled_envelope_width, scaled_envelope_height)
-            )
+            painter.drawRect(envelope)
 
 
 # --- Visualizer Window --- #
 class WallVisualizerWindow(QMainWindow):
+    # Section headers of the statistics panel
+    HEADER_PROGRESS = "═══ Build Progress ═══\n\n"
+    HEADER_COMPLETE = "═══ Build Complete! ═══\n\n"
+    HEADER_ENVELOPE = "═══ Build Envelope ═══\n\n"
+    HEADER_STATUS = "═══ Current Status ═══\n\n"
+    HEADER_DIMENSIONS = "═══ Wall Dimensions ═══\n\n"
+    HEADER_STATISTICS = "═══ Build Statistics ═══\n\n"
+
     def __init__(self, algorithm: BuildAlgorithm):
         super().__init__()
         self.algorithm = algorithm
         self.wall = algorithm.wall
 
+        # Algorithm capabilities, looked up once instead of on every stats update
+        self._caps = {
+            name: hasattr(algorithm, name)
+            for name in (
+                "build_envelope",
+                "current_stride",
+                "current_section",
+                "sections",
+                "platform_moves",
+                "statistics",
+            )
+        }
+
         self.setWindowTitle(f"Brick Wall Builder - {self.wall.bond.name}")
         self.setGeometry(100, 100, 1400, 800)
 
@@ -296,7 +479,7 @@ class WallVisualizerWindow(QMainWindow):
     def update_stats(self):
         """Update the statistics display"""
         # Check if algorithm has statistics method
-        if not hasattr(self.algorithm, "statistics"):
+        if not self._caps["statistics"]:
             self.stats_text.setPlainText(
                 "Statistics not available\nfor this algorithm."
             )
@@ -306,45 +489,43 @@ class WallVisualizerWindow(QMainWindow):
 
         if not stats:
             # Wall not complete yet - show partial stats
-            total_bricks = sum(1 for course in self.wall.courses for brick in course)
-            placed_bricks = sum(
-                1 for course in self.wall.courses for brick in course if brick.placed
-            )
+            total_bricks = self.wall.total_bricks
+            placed_bricks = self.algorithm.placed_count
 
-            text = "═══ Build Progress ═══\n\n"
+            text = self.HEADER_PROGRESS
             text += f"Bricks Placed: {placed_bricks} / {total_bricks}\n"
             text += f"Progress: {(placed_bricks/total_bricks*100):.1f}%\n\n"
 
             # Add algorithm-specific info if available
-            if hasattr(self.algorithm, "build_envelope"):
-                text += "═══ Build Envelope ═══\n\n"
+            if self._caps["build_envelope"]:
+                text += self.HEADER_ENVELOPE
                 text += f"Width:  {self.algorithm.build_envelope[0]} mm\n"
                 text += f"Height: {self.algorithm.build_envelope[1]} mm\n\n"
 
-            if hasattr(self.algorithm, "current_stride"):
-                text += "═══ Current Status ═══\n\n"
+            if self._caps["current_stride"]:
+                text += self.HEADER_STATUS
                 text += f"Stride: {self.algorithm.current_stride}\n"
-                if hasattr(self.algorithm, "current_section"):
+                if self._caps["current_section"]:
                     text += f"Section: {self.algorithm.current_section + 1}"
-                    if hasattr(self.algorithm, "sections"):
+                    if self._caps["sections"]:
                         text += f" / {self.algorithm.sections}"
                     text += "\n"
-                if hasattr(self.algorithm, "platform_moves"):
+                if self._caps["platform_moves"]:
                     text += f"Platform Moves: {self.algorithm.platform_moves}\n"
         else:
             # Wall complete - show full stats
-            text = "═══ Build Complete! ═══\n\n"
+            text = self.HEADER_COMPLETE
 
-            if hasattr(self.algorithm, "build_envelope"):
-                text += "═══ Build Envelope ═══\n\n"
+            if self._caps["build_envelope"]:
+                text += self.HEADER_ENVELOPE
                 text += f"Width:  {self.algorithm.build_envelope[0]} mm\n"
                 text += f"Height: {self.algorithm.build_envelope[1]} mm\n\n"
 
-            text += "═══ Wall Dimensions ═══\n\n"
+            text += self.HEADER_DIMENSIONS
             text += f"Width:  {self.wall.width} mm\n"
             text += f"Height: {self.wall.height} mm\n\n"
 
-            text += "═══ Build Statistics ═══\n\n"
+            text += self.HEADER_STATISTICS
 
             if "total_robot_moves" in stats:
                 text += f"Robot Moves: {stats['total_robot_moves']}\n"
@@ -363,23 +544,23 @@ class WallVisualizerWindow(QMainWindow):
         if not self.algorithm.place_next_brick():
             self.check_wall_complete()
         else:
-            self.canvas.update()
+            self.canvas.schedule_update()
             self.update_stats()
             self.status_bar.showMessage("Placed 1 brick")
 
     def place_ten(self):
-        placed = sum(self.algorithm.place_next_brick() for _ in range(10))
+        placed = self.algorithm.place_next_n(10)
         if placed == 0:
             self.check_wall_complete()
         else:
-            self.canvas.update()
+            self.canvas.schedule_update()
             self.update_stats()
             self.status_bar.showMessage(f"Placed {placed} bricks")
 
     def complete_stride(self):
         try:
             count = self.algorithm.complete_stride()
-            self.canvas.update()
+            self.canvas.schedule_update()
             self.update_stats()
             self.status_bar.showMessage(f"Completed stride with {count} bricks")
             if count == 0:
@@ -388,11 +569,8 @@ class WallVisualizerWindow(QMainWindow):
             self.status_bar.showMessage("Complete stride not implemented")
 
     def finish_wall(self):
-        placed = 0
-        while self.algorithm.next_brick() is not None:
-            self.algorithm.place_next_brick()
-            placed += 1
-        self.canvas.update()
+        placed = self.algorithm.place_next_n(sys.maxsize)
+        self.canvas.schedule_update()
         self.update_stats()
         self.check_wall_complete(f"Wall complete! Placed {placed} bricks ")
 
@@ -421,11 +599,30 @@ if __name__ == "__main__":
         width, height, bond_class, algo_class = dialog.get_selection()
         bond = bond_class()
         wall = Wall(width=width, height=height, bond=bond)
-        if isinstance(bond, WildBond):
-            bond.prepare_solution(wall)
-        wall.generate_bond_design()
-        wall.assign_support_relations()
-        wall.validate_support_relations()
-
-        algorithm = algo_class(wall)
-        visualize_wall(algorithm)
+
+        # Build the wall in the background while showing a busy indicator
+        progress = QProgressDialog("Building wall...", None, 0, 0)
+        progress.setWindowTitle("Brick Wall Builder")
+        progress.setMinimumDuration(0)
+        progress.show()
+
+        windows = []
+
+        def on_built(algorithm: BuildAlgorithm):
+            try:
+                window = WallVisualizerWindow(algorithm)
+                window.show()
+                windows.append(window)
+            finally:
+                progress.close()
+
+        def on_failed(message: str):
+            progress.close()
+            QMessageBox.critical(None, "Brick Wall Builder", message)
+            app.quit()
+
+        task = WallBuildTask(wall, algo_class)
+        task.signals.finished.connect(on_built)
+        task.signals.failed.connect(on_failed)
+        QThreadPool.globalInstance().start(task)
+        app.exec()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import abstractmethod
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from loguru import logger
@@ -9,11 +10,38 @@ if TYPE_CHECKING:
     from wall import Course, Wall
 
 
+@lru_cache(maxsize=256)
+def _adjust_width(wall_width: int, min_width: int, increment: int) -> tuple[int, int]:
+    """
+    Return the width raised to the minimum, and that width snapped to the
+    nearest multiple of the increment.
+    """
+    clamped_width = max(wall_width, min_width)
+    adjusted_width = clamped_width
+
+    if increment > 0:
+        remainder = (clamped_width - min_width) % increment
+
+        if remainder != 0:
+            # If the remainder is more than half the increment, round up.
+            if remainder > increment / 2:
+                adjusted_width = clamped_width + (increment - remainder)
+            # Otherwise, round down (this includes the halfway point).
+            else:
+                adjusted_width = clamped_width - remainder
+
+    return clamped_width, adjusted_width
+
+
 class Bond:
     """
     Abstract base class for different brick bonds.
     """
 
+    # Number of rows after which the course layout repeats, or None if every
+    # course has to be created separately
+    ROW_PERIOD: int | None = None
+
     def __init__(self, name: str) -> None:
         self.name = name
         self.min_width: int = 0
@@ -26,34 +54,30 @@ class Bond:
         The method first ensures the width meets the minimum requirement, then
         adjusts it to the nearest multiple of the bond's increment.
         """
-        adjusted_width = wall_width
-        if adjusted_width < self.min_width:
+        clamped_width, adjusted_width = _adjust_width(
+            wall_width, self.min_width, self.increment
+        )
+        if clamped_width != wall_width:
             logger.warning(
-                f"Wall width {adjusted_width} mm is less than minimum {self.min_width} mm for {self.name}. "
-                f"Adjusting to {self.min_width} mm."
+                "Wall width {} mm is less than minimum {} mm for {}. "
+                "Adjusting to {} mm.",
+                wall_width,
+                self.min_width,
+                self.name,
+                self.min_width,
+            )
+        if adjusted_width != clamped_width:
+            logger.warning(
+                "Wall width {} mm does not conform to for {}. "
+                "Adjusting to closest width: {} mm.",
+                clamped_width,
+                self.name,
+                adjusted_width,
             )
-            adjusted_width = self.min_width
-
-        if self.increment > 0:
-            remainder = (adjusted_width - self.min_width) % self.increment
-
-            if remainder != 0:
-                # If the remainder is more than half the increment, round up.
-                if remainder > self.increment / 2:
-                    new_width = adjusted_width + (self.increment - remainder)
-                # Otherwise, round down (this includes the halfway point).
-                else:
-                    new_width = adjusted_width - remainder
-
-                logger.warning(
-                    f"Wall width {adjusted_width} mm does not conform to for {self.name}. "
-                    f"Adjusting to closest width: {new_width} mm."
-                )
-                adjusted_width = new_width
 
         # If no adjustments were made, the original width was valid.
         if adjusted_width == wall_width:
-            logger.info(f"Wall width {wall_width} mm is valid for {self.name}.")
+            logger.info("Wall width {} mm is valid for {}.", wall_width, self.name)
 
         return adjusted_width
 
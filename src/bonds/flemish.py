@@ -19,6 +19,7 @@ if TYPE_CHECKING:
 
 
 class FlemishBond(Bond):
+    ROW_PERIOD = 2
 
     # FB-HB-FB
     MIN_WIDTH = BRICK_LENGTH + HALF_BRICK_LENGTH + BRICK_LENGTH + HEAD_JOINT_LENGTH * 2
@@ -44,15 +45,11 @@ class FlemishBond(Bond):
 
         if row % 2 == 0:
             course.append(FullBrick(), row)
-            while True:
-                half_b = HalfBrick()
-                full_b = FullBrick()
-
-                if course.can_fit_multiple([half_b, full_b]):
-                    course.append(half_b, row)
-                    course.append(full_b, row)
-                else:
-                    break
+            # Half + joint + full, can_fit_length adds the leading joint
+            pair_length = HalfBrick.LENGTH + HEAD_JOINT_LENGTH + FullBrick.LENGTH
+            while course.can_fit_length(pair_length):
+                course.append(HalfBrick(), row)
+                course.append(FullBrick(), row)
         else:
             # --- ODD ROWS: Flemish Bond Pattern ---
             # The required width for the fixed closing sequence
@@ -69,21 +66,16 @@ class FlemishBond(Bond):
             course.append(QuarterBrick(), row)
             course.append(FullBrick(), row)
 
-            # 2. Fill the middle with alternating Half and Full bricks
+            # 2. Fill the middle with alternating Half and Full bricks, as
+            # long as the next brick PLUS the closing sequence will fit
+            limit = course.width_limit - closing_width - HEAD_JOINT_LENGTH
             is_next_a_half = True
             while True:
-                next_brick = HalfBrick() if is_next_a_half else FullBrick()
-
-                # Check if the next brick PLUS the closing sequence will fit
-                required_width_for_step = (
-                    next_brick.length + HEAD_JOINT_LENGTH + closing_width
-                )
-
-                if course.width() + required_width_for_step <= course.width_limit:
-                    course.append(next_brick, row)
-                    is_next_a_half = not is_next_a_half
-                else:
+                length = HALF_BRICK_LENGTH if is_next_a_half else BRICK_LENGTH
+                if course.width() + length > limit:
                     break  # Not enough space for the next brick and the closing sequence
+                course.append(HalfBrick() if is_next_a_half else FullBrick(), row)
+                is_next_a_half = not is_next_a_half
 
             # 3. Add closing sequence
             course.append(QuarterBrick(), row)
@@ -16,6 +16,7 @@ if TYPE_CHECKING:
 
 
 class StretcherBond(Bond):
+    ROW_PERIOD = 2
     MIN_WIDTH = BRICK_LENGTH + HALF_BRICK_LENGTH + HEAD_JOINT_LENGTH
     INCREMENT = HALF_BRICK_LENGTH + HEAD_JOINT_LENGTH
 
@@ -28,14 +29,17 @@ class StretcherBond(Bond):
         """Create a course for the given row number."""
         course = Course(width=wall.width)
 
+        offset = 0
         if row % 2 != 0:
             course.append(HalfBrick(), row)
-
-        while True:
-            brick = FullBrick()
-            # Add bricks until we can no longer fit one
-            if not course.append(brick, row):
-                break
+            offset = HALF_BRICK_LENGTH + HEAD_JOINT_LENGTH
+
+        # Number of full bricks (each but the first after a joint) that fit
+        n = (wall.width - offset + HEAD_JOINT_LENGTH) // (
+            BRICK_LENGTH + HEAD_JOINT_LENGTH
+        )
+        for _ in range(n):
+            course.append(FullBrick(), row)
 
         # Add a half brick if there is enough space
         remaining_width = wall.width - course.width()
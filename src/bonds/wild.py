@@ -3,6 +3,7 @@ from __future__ import annotations
 import random
 from typing import TYPE_CHECKING
 
+import numpy as np
 from loguru import logger
 
 from bond import Bond
@@ -17,21 +18,53 @@ from config import (
 )
 from course import Course
 
+from .wild_kernels import build_cover_table, build_end_table, build_step_windows
+
 if TYPE_CHECKING:
     from wall import Wall
 
 from ortools.sat.python import cp_model
 
+# Walls up to this many quarter-brick cells are laid out by _greedy_wild first
+GREEDY_MAX_CELLS = 800
+# Number of brick choices _greedy_wild may try before giving up
+GREEDY_MAX_STEPS = 50_000
+
+# Solver results per (rows, cols_quarter, max_stagger_steps), see prepare_solution
+_SOLUTION_CACHE: dict[
+    tuple[int, int, int], tuple[list[bytes], list[tuple[str, int, int, int]]]
+] = {}
+
+# Brick class and number of quarter-brick columns per placement code
+_DECODE = {
+    ord("F"): (FullBrick, 4),
+    ord("H"): (HalfBrick, 2),
+    ord("T"): (ThreeQuarterBrick, 3),
+}
+# Placement code per brick kind in the list of bricks
+_CODES = {"full": ord("F"), "half": ord("H"), "3q": ord("T")}
+
+
+def _placement_grid(
+    bricks: list[tuple[str, int, int, int]], rows: int, cols_quarter: int
+) -> np.ndarray:
+    """Return the (rows, cols_quarter) uint8 grid of placement codes of bricks."""
+    placement = np.full((rows, cols_quarter), ord("."), dtype=np.uint8)
+    for kind, r, s, e in bricks:
+        placement[r, s : e + 1] = _CODES[kind]
+    return placement
+
 
 def solve_wild_brick(
     rows,
     cols_quarter,  # number of quarter-brick columns (full=4, half=2, three-quarter=3)
     max_stagger_steps=6,  # allowed maximum consecutive step transitions
     verbose=True,
-) -> tuple[list[list[str]], list[tuple[str, int, int, int]]] | None:
+) -> tuple[list[bytes], list[tuple[str, int, int, int]]] | None:
     """
     Solve the Wild Bond layout using constraint programming.
     Returns a tuple of (placement grid, list of bricks) or None if no solution found.
+    Every row of the placement grid is a bytes object with one code per column.
 
     """
     model = cp_model.CpModel()
@@ -77,65 +110,58 @@ def solve_wild_brick(
 
     # Coverage:
     # every cell can only be covered exactly once
+    full_cover, half_cover, threeq_cover = (t.tolist() for t in build_cover_table(C))
     for r in range(R):
         for c in range(C):
-            covering_vars = []
-            for s in range(max(0, c - 3), c + 1):
-                if (r, s) in full_start and s <= c <= s + 3:
-                    covering_vars.append(full_start[(r, s)])
-            for s in range(max(0, c - 1), c + 1):
-                if (r, s) in half_start and s <= c <= s + 1:
-                    covering_vars.append(half_start[(r, s)])
-            for s in range(max(0, c - 2), c + 1):
-                if (r, s) in threeq_start and s <= c <= s + 2:
-                    covering_vars.append(threeq_start[(r, s)])
+            covering_vars = [full_start[(r, s)] for s in full_cover[c] if s >= 0]
+            covering_vars += [half_start[(r, s)] for s in half_cover[c] if s >= 0]
+            covering_vars += [threeq_start[(r, s)] for s in threeq_cover[c] if s >= 0]
             model.Add(sum(covering_vars) == 1)
 
     # --- Joint variables ---
     # A joint is where a brick ends (at the quarter-brick level)
-    # We create joint variables at every possible joint position (beyond the wall edges)
+    # We create joint variables at every position where some brick can end
     # Endings are determined by tracing forwards from brick start positions
     end_at = {}
+    end_table = build_end_table(C).tolist()
     for r in range(R):
         for b in range(C):
+            full_s, half_s, threeq_s = end_table[b]
             ends = []
-            if (r, b - 3) in full_start:
-                ends.append(full_start[(r, b - 3)])
-            if (r, b - 1) in half_start:
-                ends.append(half_start[(r, b - 1)])
-            if (r, b - 2) in threeq_start:
-                ends.append(threeq_start[(r, b - 2)])
+            if full_s >= 0:
+                ends.append(full_start[(r, full_s)])
+            if half_s >= 0:
+                ends.append(half_start[(r, half_s)])
+            if threeq_s >= 0:
+                ends.append(threeq_start[(r, threeq_s)])
             if ends:
+                # Column b is covered exactly once, so at most one brick ends there
                 end_at[(r, b)] = model.NewBoolVar(f"end_r{r}_at{b}")
-                model.Add(sum(ends) >= 1).OnlyEnforceIf(end_at[(r, b)])
-                model.Add(sum(ends) == 0).OnlyEnforceIf(end_at[(r, b)].Not())
-            else:
-                v = model.NewBoolVar(f"end_r{r}_at{b}_const0")
-                model.Add(v == 0)
-                end_at[(r, b)] = v
+                model.Add(sum(ends) == end_at[(r, b)])
 
     # Joint variables: a joint exists where a brick ends and the next brick starts
     # Any cell boundary can be a joint (if we were using quarter bricks), except the wall edges
     # Joints are only valid if there is a brick ending before them
     # Since joints are between bricks, we sort of index them at the end of the previous brick
+    # Positions without a joint entry can never hold a joint, constraints
+    # involving them are satisfied trivially and left out
     joint = {}
     for r in range(R):
         for b in range(1, C):
-            joint[(r, b)] = model.NewBoolVar(f"joint_r{r}_b{b}")
-            model.Add(joint[(r, b)] == end_at[(r, b - 1)])
+            if (r, b - 1) in end_at:
+                joint[(r, b)] = end_at[(r, b - 1)]
 
     # --- Constraint 1: No joints directly above each other ---
     for r in range(R - 1):
         for b in range(1, C):
-            model.Add(joint[(r, b)] + joint[(r + 1, b)] <= 1)
+            if (r, b) in joint and (r + 1, b) in joint:
+                model.Add(joint[(r, b)] + joint[(r + 1, b)] <= 1)
 
     # --- Constraint 2: No two half bricks next to each other (except edges) ---
     for r in range(R):
-        for b in range(1, C):
-            end_half_var = half_start.get((r, b - 1), model.NewConstant(0))
-            start_half_var = half_start.get((r, b), model.NewConstant(0))
-            if 1 < b < C - 1:
-                model.Add(end_half_var + start_half_var <= 1)
+        for b in range(2, C - 1):
+            if (r, b - 1) in half_start and (r, b) in half_start:
+                model.Add(half_start[(r, b - 1)] + half_start[(r, b)] <= 1)
 
     # --- Constraint 3: Limit consecutive staggered steps (diagonals) ---
     step = {}
@@ -143,22 +169,23 @@ def solve_wild_brick(
         for b in range(1, C):
             for d in (-1, 1):
                 b2 = b + d
-                if 1 <= b2 <= C - 1:
+                if (r, b) in joint and (r + 1, b2) in joint:
                     v = model.NewBoolVar(f"step_r{r}_b{b}_d{d}")
                     model.Add(v <= joint[(r, b)])
                     model.Add(v <= joint[(r + 1, b2)])
                     model.Add(v >= joint[(r, b)] + joint[(r + 1, b2)] - 1)
                     step[(r, b, d)] = v
-                else:
-                    step[(r, b, d)] = model.NewConstant(0)
 
     L = max_stagger_steps
+    windows = build_step_windows(C, L)
     for d in (-1, 1):
+        origins = windows[windows[:, 0] == d, 1].tolist()
         for r0 in range(0, R - L):
-            for b in range(1, C):
-                b_end = b + (L - 1) * d
-                if 1 <= b_end <= C - 1:
-                    trans_vars = [step[(r0 + i, b + i * d, d)] for i in range(L)]
+            for b in origins:
+                # A window with an impossible step can never be complete
+                keys = [(r0 + i, b + i * d, d) for i in range(L)]
+                if all(key in step for key in keys):
+                    trans_vars = [step[key] for key in keys]
                     model.Add(sum(trans_vars) <= L - 1)
 
     # --- Constraint 4: Limit long back-and-forth (zigzag) stepping ---
@@ -169,15 +196,19 @@ def solve_wild_brick(
     # Zigzag over (b, b+1)
     for r0 in range(0, R - L2 + 1):
         for b in range(1, C - 1):  # need b and b+1 both valid joint columns
-            pattern = [joint[(r0 + i, b + (i % 2))] for i in range(L2)]
-            # Not all rows in this window may alternate perfectly
-            model.Add(sum(pattern) <= L2 - 1)
+            keys = [(r0 + i, b + (i % 2)) for i in range(L2)]
+            if all(key in joint for key in keys):
+                pattern = [joint[key] for key in keys]
+                # Not all rows in this window may alternate perfectly
+                model.Add(sum(pattern) <= L2 - 1)
 
     # Zigzag over (b, b-1)
     for r0 in range(0, R - L2 + 1):
         for b in range(2, C):  # need b and b-1 both valid
-            pattern = [joint[(r0 + i, b - (i % 2))] for i in range(L2)]
-            model.Add(sum(pattern) <= L2 - 1)
+            keys = [(r0 + i, b - (i % 2)) for i in range(L2)]
+            if all(key in joint for key in keys):
+                pattern = [joint[key] for key in keys]
+                model.Add(sum(pattern) <= L2 - 1)
 
     # Objective: fewer half bricks
     total_half = (
@@ -195,30 +226,117 @@ def solve_wild_brick(
         return None
 
     # Extract solution
-    placement = [["." for _ in range(C)] for _ in range(R)]
-    bricks = []
-    for (r, s), v in full_start.items():
-        if solver.Value(v):
-            for x in range(s, s + 4):
-                placement[r][x] = "F"
-            bricks.append(("full", r, s, s + 3))
-    for (r, s), v in half_start.items():
-        if solver.Value(v):
-            for x in range(s, s + 2):
-                placement[r][x] = "H"
-            bricks.append(("half", r, s, s + 1))
-    for (r, s), v in threeq_start.items():
-        if solver.Value(v):
-            for x in range(s, s + 3):
-                placement[r][x] = "T"
-            bricks.append(("3q", r, s, s + 2))
+    bricks = [
+        ("full", r, s, s + 3) for (r, s), v in full_start.items() if solver.Value(v)
+    ]
+    bricks += [
+        ("half", r, s, s + 1) for (r, s), v in half_start.items() if solver.Value(v)
+    ]
+    bricks += [
+        ("3q", r, s, s + 2) for (r, s), v in threeq_start.items() if solver.Value(v)
+    ]
+    placement = _placement_grid(bricks, R, C)
 
     if verbose:
         print(f"Status: {solver.StatusName(status)}")
         for r in range(R):
-            print(f"{r:02d}: {''.join(placement[r])}")
+            print(f"{r:02d}: {placement[r].tobytes().decode()}")
 
-    return placement, bricks
+    return [row.tobytes() for row in placement], bricks
+
+
+def _greedy_wild(
+    rows: int,
+    cols_quarter: int,
+    rng: random.Random,
+    max_stagger_steps: int = 6,
+    max_steps: int = GREEDY_MAX_STEPS,
+) -> tuple[list[bytes], list[tuple[str, int, int, int]]] | None:
+    """
+    Lay out a Wild Bond row by row with a randomized backtracking search.
+
+    Bricks are placed left to right, preferring full bricks, and a brick is
+    only placed if the joint after it is not directly above a joint in the
+    previous row, does not extend a staircase or zigzag of joints beyond
+    max_stagger_steps and is not a third half brick in a row.
+    Returns the same (placement grid, list of bricks) as solve_wild_brick, or
+    None if no layout was found within max_steps brick choices.
+    """
+    C = cols_quarter
+    L = max_stagger_steps
+    joints: list[set[int]] = []  # joint columns of every completed row
+    row_bricks: list[tuple[str, int, int]] = []  # (code, start, span) of current row
+    layout: list[list[tuple[str, int, int]]] = []
+    steps_left = max_steps
+
+    def joint_allowed(r: int, b: int) -> bool:
+        if r == 0:
+            return True
+        if b in joints[r - 1]:
+            return False
+        for d in (-1, 1):
+            # Staircase: joints at b - d, b - 2d, ... in the rows below
+            k = 0
+            while k < L and k < r and b - (k + 1) * d in joints[r - k - 1]:
+                k += 1
+            if k >= L:
+                return False
+            # Zigzag: joints alternating between b + d and b in the rows below
+            k = 0
+            while k < L and k < r and b + d * ((k + 1) % 2) in joints[r - k - 1]:
+                k += 1
+            if k >= L:
+                return False
+        return True
+
+    def place(r: int, p: int, halves: int, row_joints: set[int]) -> bool:
+        nonlocal steps_left
+        if p == C:
+            joints.append(row_joints)
+            layout.append(row_bricks[:])
+            row_bricks.clear()
+            if r + 1 == rows or place(r + 1, 0, 0, set()):
+                return True
+            joints.pop()
+            row_bricks.extend(layout.pop())
+            return False
+
+        options = []
+        if p + 4 <= C:
+            options.append(("F", 4))
+        if p + 2 <= C and halves < 2:
+            options.append(("H", 2))
+        if (p == 0 or p == C - 3) and p + 3 <= C:
+            options.append(("T", 3))
+        rng.shuffle(options)
+        options.sort(key=lambda option: option[0] == "H")
+
+        for code, span in options:
+            if steps_left <= 0:
+                return False
+            steps_left -= 1
+            end = p + span
+            if end < C and not joint_allowed(r, end):
+                continue
+            row_bricks.append((code, p, span))
+            next_halves = halves + 1 if code == "H" else 0
+            next_joints = row_joints | {end} if end < C else row_joints
+            if place(r, end, next_halves, next_joints):
+                return True
+            row_bricks.pop()
+        return False
+
+    if rows <= 0 or not place(0, 0, 0, set()):
+        return None
+
+    names = {"F": "full", "H": "half", "T": "3q"}
+    bricks = [
+        (names[code], r, start, start + span - 1)
+        for r, row in enumerate(layout)
+        for code, start, span in row
+    ]
+    placement = _placement_grid(bricks, rows, C)
+    return [row.tobytes() for row in placement], bricks
 
 
 class WildBond(Bond):
@@ -226,6 +344,10 @@ class WildBond(Bond):
     Wild Bond (Wildverband) implementated using constraint programming.
     """
 
+    # Every course follows its own row of the solution, the solver result
+    # itself is cached instead
+    ROW_PERIOD = None
+
     MIN_WIDTH = HALF_BRICK_LENGTH + THREE_QUARTER_BRICK_LENGTH + HEAD_JOINT_LENGTH
     INCREMENT = HALF_BRICK_LENGTH + HEAD_JOINT_LENGTH
 
@@ -246,15 +368,27 @@ class WildBond(Bond):
             int((wall.height - BRICK_HEIGHT) // (BRICK_HEIGHT + BED_JOINT_HEIGHT)) + 1
         )
 
-        result = solve_wild_brick(
-            rows=rows,
-            cols_quarter=cols_quarter,
-            max_stagger_steps=max_stagger_steps,
-            verbose=False,
-        )
-        if result is None:
-            raise ValueError("No solution found for the given wall dimensions.")
-        self.solution = result
+        if rows * cols_quarter <= GREEDY_MAX_CELLS:
+            result = _greedy_wild(
+                rows, cols_quarter, self.random, max_stagger_steps=max_stagger_steps
+            )
+            if result is not None:
+                self.solution = result
+                return
+            logger.info("Greedy Wild Bond layout failed, falling back to CP-SAT.")
+
+        key = (rows, cols_quarter, max_stagger_steps)
+        if key not in _SOLUTION_CACHE:
+            result = solve_wild_brick(
+                rows=rows,
+                cols_quarter=cols_quarter,
+                max_stagger_steps=max_stagger_steps,
+                verbose=False,
+            )
+            if result is None:
+                raise ValueError("No solution found for the given wall dimensions.")
+            _SOLUTION_CACHE[key] = result
+        self.solution = _SOLUTION_CACHE[key]
 
     def create_course(self, row: int, wall: Wall) -> Course:
         """Create a course for the given row number."""
@@ -264,20 +398,15 @@ class WildBond(Bond):
             )
         placement, _ = self.solution
         course = Course(width=wall.width)
+        row_codes = placement[row]
         i = 0
-        while i < len(placement[row]):
-            brick_code = placement[row][i]
-            if brick_code == "F":
-                brick = FullBrick()
-                i += 4
-            elif brick_code == "H":
-                brick = HalfBrick()
-                i += 2
-            elif brick_code == "T":
-                brick = ThreeQuarterBrick()
-                i += 3
-            else:
-                raise ValueError(f"Unknown brick code '{brick_code}' in placement.")
+        while i < len(row_codes):
+            code = row_codes[i]
+            if code not in _DECODE:
+                raise ValueError(f"Unknown brick code '{chr(code)}' in placement.")
+            brick_class, step = _DECODE[code]
+            brick = brick_class()
+            i += step
             if not course.append(brick, row):
                 logger.warning(f"Could not fit brick {brick} in course at row {row}.")
         return course
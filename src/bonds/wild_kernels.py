@@ -0,0 +1,91 @@
+"""
+Compiled index tables for the Wild Bond constraint model.
+
+A course is C quarter-brick columns wide. Full bricks span 4 columns and may
+start anywhere they fit, half bricks span 2 and three-quarter bricks span 3
+columns but only start at column 0 or C - 3. The tables below hold brick
+start columns, padded with -1, and are identical for every row.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def _threeq_starts(C):
+    """Start columns of three-quarter bricks, without the duplicate for C == 3."""
+    if C < 3:
+        return np.empty(0, np.int32)
+    if C == 3:
+        return np.zeros(1, np.int32)
+    starts = np.empty(2, np.int32)
+    starts[0] = 0
+    starts[1] = C - 3
+    return starts
+
+
+@njit(cache=True)
+def build_cover_table(C):
+    """
+    Return the start columns of the full, half and three-quarter bricks that
+    cover each column, as (C, 4), (C, 2) and (C, 2) arrays in ascending order.
+    """
+    full_idx = np.full((C, 4), -1, np.int32)
+    half_idx = np.full((C, 2), -1, np.int32)
+    threeq_idx = np.full((C, 2), -1, np.int32)
+    threeq = _threeq_starts(C)
+    for c in range(C):
+        k = 0
+        for s in range(max(0, c - 3), c + 1):
+            if s + 4 <= C:
+                full_idx[c, k] = s
+                k += 1
+        k = 0
+        for s in range(max(0, c - 1), c + 1):
+            if s + 2 <= C:
+                half_idx[c, k] = s
+                k += 1
+        k = 0
+        for s in threeq:
+            if s <= c <= s + 2:
+                threeq_idx[c, k] = s
+                k += 1
+    return full_idx, half_idx, threeq_idx
+
+
+@njit(cache=True)
+def build_end_table(C):
+    """
+    Return a (C, 3) array with the start columns of the full, half and
+    three-quarter brick that would end at each column.
+    """
+    end_idx = np.full((C, 3), -1, np.int32)
+    threeq = _threeq_starts(C)
+    for b in range(C):
+        if b >= 3:
+            end_idx[b, 0] = b - 3
+        if b >= 1:
+            end_idx[b, 1] = b - 1
+        for s in threeq:
+            if s == b - 2:
+                end_idx[b, 2] = s
+    return end_idx
+
+
+@njit(cache=True)
+def build_step_windows(C, L):
+    """
+    Return the (direction, joint column) origins of all staircases of L steps
+    that stay within the inner joint columns 1 .. C - 1, as an (n, 2) array
+    ordered by direction (-1 first), then column.
+    """
+    windows = np.empty((2 * C, 2), np.int32)
+    n = 0
+    for d in (-1, 1):
+        for b in range(1, C):
+            b_end = b + (L - 1) * d
+            if 1 <= b_end <= C - 1:
+                windows[n, 0] = d
+                windows[n, 1] = b
+                n += 1
+    return windows[:n]
@@ -1,4 +1,6 @@
-from enum import Enum
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
 from config import (
     BRICK_LENGTH,
@@ -7,10 +9,8 @@ from config import (
     THREE_QUARTER_BRICK_LENGTH,
 )
 
-
-class BrickState(Enum):
-    EMPTY = "empty"
-    PLACED = "placed"
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 
 class Brick:
@@ -18,9 +18,23 @@ class Brick:
     A brick in the wall.
     """
 
+    __slots__ = (
+        "_placed",
+        "brick_index",
+        "length",
+        "loads",
+        "on_place",
+        "row",
+        "stride_index",
+        "supports",
+        "uid",
+        "x_end",
+        "x_start",
+    )
+
     def __init__(self, length: int = BRICK_LENGTH):
         self.uid = None
-        self.state = BrickState.EMPTY
+        self._placed = False
         self.length = length
 
         self.row = -1
@@ -32,33 +46,67 @@ class Brick:
         self.x_end: int | None = None
         self.supports: list[Brick] = []
         self.loads: list[Brick] = []
+        # Called once when the brick is placed, set by the wall it belongs to
+        self.on_place: Callable[[Brick], None] | None = None
+
+    def __copy__(self):
+        # Copies the brick's own state, a copy has no supports or loads yet
+        new = object.__new__(type(self))
+        new.uid = None
+        new._placed = self._placed
+        new.length = self.length
+        new.row = self.row
+        new.brick_index = self.brick_index
+        new.stride_index = self.stride_index
+        new.x_start = self.x_start
+        new.x_end = self.x_end
+        new.supports = []
+        new.loads = []
+        new.on_place = None
+        return new
 
     def place(self):
-        self.state = BrickState.PLACED
+        if self._placed:
+            return
+        self._placed = True
+        if self.on_place is not None:
+            self.on_place(self)
 
     @property
     def placed(self):
-        return self.state == BrickState.PLACED
+        return self._placed
 
     def id(self):
         return f"R{self.row}B{self.brick_index}"
 
 
 class FullBrick(Brick):
+    __slots__ = ()
+    LENGTH = BRICK_LENGTH
+
     def __init__(self):
-        super().__init__(length=BRICK_LENGTH)
+        super().__init__(length=self.LENGTH)
 
 
 class HalfBrick(Brick):
+    __slots__ = ()
+    LENGTH = HALF_BRICK_LENGTH
+
     def __init__(self):
-        super().__init__(length=HALF_BRICK_LENGTH)
+        super().__init__(length=self.LENGTH)
 
 
 class QuarterBrick(Brick):
+    __slots__ = ()
+    LENGTH = QUARTER_BRICK_LENGTH
+
     def __init__(self):
-        super().__init__(length=QUARTER_BRICK_LENGTH)
+        super().__init__(length=self.LENGTH)
 
 
 class ThreeQuarterBrick(Brick):
+    __slots__ = ()
+    LENGTH = THREE_QUARTER_BRICK_LENGTH
+
     def __init__(self):
-        super().__init__(length=THREE_QUARTER_BRICK_LENGTH)
+        super().__init__(length=self.LENGTH)
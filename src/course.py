@@ -1,4 +1,9 @@
-from typing import Any
+from array import array
+from collections.abc import Iterator
+from copy import copy
+from typing import overload
+
+import numpy as np
 
 from brick import Brick
 from config import (
@@ -6,19 +11,68 @@ from config import (
 )
 
 
-class Course(list[Brick]):
+class Course:
     """
     A Course is a horizontal layer of bricks in a wall.
     It manages the placement of bricks within the course, ensuring they fit within the specified width.
+
+    Besides the Brick objects, the course keeps their positions in parallel
+    arrays, see xy_arrays().
     """
 
-    def __init__(self, *args: Any, width: int = 2000, **kwargs: Any) -> None:
-        super().__init__(*args, **kwargs)
+    def __init__(self, width: int = 2000) -> None:
         self.width_limit = width
         self._current_span_mm = 0
+        self._bricks: list[Brick] = []
+        self._xstart = array("i")
+        self._xend = array("i")
+
+        # Extent of the placed bricks, maintained through mark_placed()
+        self.any_placed = False
+        self.max_placed_x_end = 0
+        self.min_placed_x_start = width
+        # Bit i is set once the brick with brick_index i is placed
+        self._placed_bits = 0
+        self._full_mask = 0
+
+    def __len__(self) -> int:
+        return len(self._bricks)
+
+    def __iter__(self) -> Iterator[Brick]:
+        return iter(self._bricks)
+
+    @overload
+    def __getitem__(self, index: int) -> Brick: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Brick]: ...
+
+    def __getitem__(self, index: int | slice) -> Brick | list[Brick]:
+        return self._bricks[index]
+
+    def __copy__(self) -> "Course":
+        # Unlike a shallow list copy, the new course holds copies of the bricks
+        new = Course(width=self.width_limit)
+        new._current_span_mm = self._current_span_mm
+        new._bricks = [copy(brick) for brick in self._bricks]
+        new._xstart = array("i", self._xstart)
+        new._xend = array("i", self._xend)
+        new.any_placed = self.any_placed
+        new.max_placed_x_end = self.max_placed_x_end
+        new.min_placed_x_start = self.min_placed_x_start
+        new._placed_bits = self._placed_bits
+        new._full_mask = self._full_mask
+        return new
+
+    def __repr__(self) -> str:
+        return repr(self._bricks)
 
     def width(self) -> int:
-        return sum(brick.length for brick in self) + HEAD_JOINT_LENGTH * (len(self) - 1)
+        return self._current_span_mm
+
+    def xy_arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return copies of the x_start and x_end positions of all bricks."""
+        return np.array(self._xstart), np.array(self._xend)
 
     def append(self, brick: Brick, row: int) -> bool:
         """
@@ -29,13 +83,18 @@ class Course(list[Brick]):
 
         if not self:
             brick.x_start = 0
+            self._current_span_mm = brick.length
         else:
-            brick.x_start = self[-1].x_end + HEAD_JOINT_LENGTH
+            brick.x_start = self._xend[-1] + HEAD_JOINT_LENGTH
+            self._current_span_mm += HEAD_JOINT_LENGTH + brick.length
 
         brick.x_end = brick.x_start + brick.length
         brick.row = row
         brick.brick_index = len(self)
-        super().append(brick)
+        self._bricks.append(brick)
+        self._xstart.append(brick.x_start)
+        self._xend.append(brick.x_end)
+        self._full_mask = (1 << len(self)) - 1
         return True
 
     def can_fit(self, brick: Brick, width: int = None) -> bool:
@@ -45,11 +104,32 @@ class Course(list[Brick]):
         width_required = brick.length + (HEAD_JOINT_LENGTH if self else 0)
         if width is None:
             width = self.width_limit
-        return self.width() + width_required <= width
+        return self._current_span_mm + width_required <= width
+
+    def can_fit_length(self, length: int) -> bool:
+        """
+        Check if a brick of the given length would still fit in the course.
+        """
+        width_required = length + (HEAD_JOINT_LENGTH if self else 0)
+        return self._current_span_mm + width_required <= self.width_limit
 
     def can_fit_multiple(self, bricks: list[Brick]) -> bool:
         total_length = sum(brick.length for brick in bricks)
-        width_required = total_length + (
-            HEAD_JOINT_LENGTH * (len(bricks) - 1) if self else 0
-        )
-        return self.width() + width_required <= self.width_limit
+        # Every brick needs a head joint, except the first one of an empty course
+        joints = len(bricks) if self else len(bricks) - 1
+        width_required = total_length + HEAD_JOINT_LENGTH * joints
+        return self._current_span_mm + width_required <= self.width_limit
+
+    def mark_placed(self, brick: Brick) -> None:
+        """
+        Update the extent of placed bricks after a brick in this course is placed.
+        """
+        self.any_placed = True
+        self._placed_bits |= 1 << brick.brick_index
+        self.max_placed_x_end = max(self.max_placed_x_end, brick.x_end)
+        self.min_placed_x_start = min(self.min_placed_x_start, brick.x_start)
+
+    @property
+    def all_placed(self) -> bool:
+        """Whether every brick in the course has been marked as placed."""
+        return self._placed_bits == self._full_mask
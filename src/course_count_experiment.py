@@ -1,3 +1,7 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
 from loguru import logger
 
 from algos.limited_course_stride import LimitedCourseStride
@@ -20,6 +24,29 @@ def score(stats: dict) -> tuple[int, int, float]:
     )
 
 
+def _evaluate_max_courses(
+    i: int, width: int, height: int, build_envelope: tuple[int, int]
+) -> tuple[int, dict | None]:
+    """
+    Build a complete wall with LimitedCourseStride using max_courses=i.
+    Returns i with the statistics, or None if the wall could not be completed.
+    """
+    logger.info(f"--- Testing LimitedCourseStride with max_courses={i} ---")
+    wall = Wall(width=width, height=height, bond=StretcherBond())
+    wall.generate_bond_design()
+    wall.assign_support_relations()
+    algo = LimitedCourseStride(wall, max_courses=i, build_envelope=build_envelope)
+
+    # Build the entire wall
+    while True:
+        placed = algo.complete_stride()
+        if placed == 0:
+            break
+    if not wall.complete:
+        return i, None
+    return i, algo.statistics()
+
+
 def run_experiment(
     width: int = 2300,
     height: int = 2000,
@@ -44,30 +71,27 @@ def run_experiment(
 
     results: list[tuple[int, dict]] = []
 
-    for i in max_courses_range:
-        logger.info("")
-        logger.info(f"--- Testing LimitedCourseStride with max_courses={i} ---")
-        wall = Wall(width=width, height=height, bond=StretcherBond())
-        wall.generate_bond_design()
-        wall.assign_support_relations()
-        algo = LimitedCourseStride(wall, max_courses=i, build_envelope=build_envelope)
-
-        # Build the entire wall
-        while True:
-            placed = algo.complete_stride()
-            if placed == 0:
-                break
-        if not wall.complete:
-            logger.warning(
-                f"Wall is not fully complete after building, skipping stats for max_courses={i}."
-            )
-            continue
-
-        stats = algo.statistics()
-        results.append((i, stats))
-        logger.info("Statistics:")
-        for key, value in stats.items():
-            logger.info(f"  {key}: {value}")
+    # Every configuration builds its own wall, so they are evaluated in parallel
+    workers = max(1, min(len(max_courses_range), os.cpu_count() or 1))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        evaluations = executor.map(
+            _evaluate_max_courses,
+            max_courses_range,
+            repeat(width),
+            repeat(height),
+            repeat(build_envelope),
+        )
+        for i, stats in evaluations:
+            if stats is None:
+                logger.warning(
+                    f"Wall is not fully complete after building, skipping stats for max_courses={i}."
+                )
+                continue
+            results.append((i, stats))
+            logger.info("")
+            logger.info(f"--- Statistics for max_courses={i} ---")
+            for key, value in stats.items():
+                logger.info(f"  {key}: {value}")
 
     # Summary table
     logger.info("")
@@ -1,11 +1,20 @@
+import copy
+from collections.abc import Callable
+
+import numpy as np
 from loguru import logger
 
 from bond import Bond
+from brick import Brick
 from config import (
     BED_JOINT_HEIGHT,
     BRICK_HEIGHT,
 )
 from course import Course
+from wall_kernels import find_supports, release_loads
+
+# Pristine course templates per (bond type, width), see generate_bond_design
+_BOND_CACHE: dict[tuple[str, int], list[Course]] = {}
 
 
 class Wall:
@@ -24,6 +33,9 @@ class Wall:
         self.bond = bond
         self.adjust_dimensions_to_bond()
         self.courses: list[Course] = []
+        # Optional hook, called with every brick placed in this wall
+        self.on_brick_placed: Callable[[Brick], None] | None = None
+        self.index_bricks()
 
     def adjust_dimensions_to_bond(self) -> None:
         """Snap width & height to nearest legal modular sizes."""
@@ -45,7 +57,21 @@ class Wall:
 
     @property
     def complete(self) -> bool:
-        return all(brick.placed for course in self.courses for brick in course)
+        return self.placed_count == self.total_bricks
+
+    def mark_placed(self, brick: Brick) -> None:
+        """
+        Record a placed brick in the wall's arrays, counters and course, and
+        release the bricks it carries. Called through Brick.place().
+        """
+        i = self.brick_idx[brick]
+        self.placed_arr[i] = True
+        self.placed_count += 1
+        self.placed_length += brick.length
+        self.courses[brick.row].mark_placed(brick)
+        release_loads(i, self.pending, self.load_ptr, self.load_idx)
+        if self.on_brick_placed is not None:
+            self.on_brick_placed(brick)
 
     def generate_bond_design(self) -> list[Course]:
         logger.info("Building wall...")
@@ -53,7 +79,62 @@ class Wall:
             (self.height + BED_JOINT_HEIGHT) // (BRICK_HEIGHT + BED_JOINT_HEIGHT)
         )
         logger.info(f"Wall will have {rows} rows.")
-        self.courses = [self.bond.create_course(row, self) for row in range(rows)]
+        period = self.bond.ROW_PERIOD
+        if period is None:
+            self.courses = [self.bond.create_course(row, self) for row in range(rows)]
+        else:
+            # Courses repeat every period rows, so every course is a copy of a
+            # shared, never placed template for its row in the period
+            key = (type(self.bond).__name__, self.width)
+            if key not in _BOND_CACHE:
+                _BOND_CACHE[key] = [
+                    self.bond.create_course(row, self) for row in range(period)
+                ]
+            templates = _BOND_CACHE[key]
+            self.courses = [copy.copy(templates[row % period]) for row in range(rows)]
+            for row, course in enumerate(self.courses):
+                for brick in course:
+                    brick.row = row
+        self.index_bricks()
+
+    def index_bricks(self) -> None:
+        """
+        Number all bricks course by course and mirror their positions and
+        placed state in flat arrays (one entry per brick), so that algorithms
+        can select bricks with vectorized operations.
+        """
+        self.bricks = [brick for course in self.courses for brick in course]
+        self.total_bricks = len(self.bricks)
+        self.brick_idx = {brick: i for i, brick in enumerate(self.bricks)}
+        n = self.total_bricks
+        self.x_start_arr = np.fromiter((b.x_start for b in self.bricks), np.int64, n)
+        self.x_end_arr = np.fromiter((b.x_end for b in self.bricks), np.int64, n)
+        self.placed_arr = np.fromiter((b.placed for b in self.bricks), bool, n)
+        self.placed_count = int(self.placed_arr.sum())
+        self.placed_length = sum(b.length for b in self.bricks if b.placed)
+        for brick in self.bricks:
+            brick.on_place = self.mark_placed
+        self.index_loads()
+
+    def index_loads(self) -> None:
+        """
+        Count the unplaced supports of every brick (a brick can be placed once
+        its count reaches zero) and store the loads of all bricks in CSR form,
+        see wall_kernels.
+        """
+        bricks = self.bricks
+        self.pending = np.fromiter(
+            (sum(not s.placed for s in brick.supports) for brick in bricks),
+            np.int32,
+            len(bricks),
+        )
+        self.load_ptr = np.zeros(len(bricks) + 1, np.int32)
+        np.cumsum([len(brick.loads) for brick in bricks], out=self.load_ptr[1:])
+        self.load_idx = np.fromiter(
+            (self.brick_idx[load] for brick in bricks for load in brick.loads),
+            np.int32,
+            self.load_ptr[-1],
+        )
 
     def validate_design(self) -> bool:
         """Validate that all courses are equal to the wall width."""
@@ -69,24 +150,18 @@ class Wall:
 
     def assign_support_relations(self) -> None:
         """Populate structural relationships between bricks."""
-        if len(self.courses) < 2:
-            return
         for below, current in zip(self.courses, self.courses[1:]):
-            for brick in current:
-                if brick.x_start is None or brick.x_end is None:
-                    continue
-                left = brick.x_start + 1
-                right = brick.x_end - 1
-                supports = [
-                    b
-                    for b in below
-                    if b.x_start is not None
-                    and b.x_end is not None
-                    and not (b.x_end <= left or b.x_start >= right)
-                ]
-                for s in supports:
-                    brick.supports.append(s)
-                    s.loads.append(brick)
+            below_start, below_end = below.xy_arrays()
+            current_start, current_end = current.xy_arrays()
+            upper_idx, lower_idx = find_supports(
+                current_start, current_end, below_start, below_end
+            )
+            for i, j in zip(upper_idx.tolist(), lower_idx.tolist()):
+                brick = current[i]
+                s = below[j]
+                brick.supports.append(s)
+                s.loads.append(brick)
+        self.index_loads()
 
     def debug_support_relations(self) -> None:
         for i, course in enumerate(self.courses):
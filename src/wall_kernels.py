@@ -0,0 +1,47 @@
+"""
+Compiled inner loops of the wall design.
+
+Courses are passed as arrays of brick positions, sorted by x_start, with the
+bricks of a course not overlapping each other (see Course.xy_arrays).
+The loads of brick i are stored in CSR form as
+load_idx[load_ptr[i] : load_ptr[i + 1]] (see Wall.index_loads).
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def find_supports(upper_starts, upper_ends, lower_starts, lower_ends):
+    """
+    Return the index pairs (upper_idx, lower_idx) of all bricks in the lower
+    course that overlap a brick in the upper course by more than 1 mm,
+    ordered by upper brick, then lower brick.
+    """
+    n = len(upper_starts)
+    m = len(lower_starts)
+    # Two sorted sequences of disjoint intervals overlap in at most n + m pairs
+    upper_idx = np.empty(n + m, np.int32)
+    lower_idx = np.empty(n + m, np.int32)
+    k = 0
+    first = 0
+    for i in range(n):
+        left = upper_starts[i] + 1
+        right = upper_ends[i] - 1
+        # Lower bricks ending before this brick also end before the next one
+        while first < m and lower_ends[first] <= left:
+            first += 1
+        j = first
+        while j < m and lower_starts[j] < right:
+            upper_idx[k] = i
+            lower_idx[k] = j
+            k += 1
+            j += 1
+    return upper_idx[:k], lower_idx[:k]
+
+
+@njit(cache=True)
+def release_loads(i, pending, load_ptr, load_idx):
+    """Decrement the unplaced support count of every brick carried by brick i."""
+    for k in range(load_ptr[i], load_ptr[i + 1]):
+        pending[load_idx[k]] -= 1
@@ -1,3 +1,5 @@
+import sys
+
 from algos import BrickByBrick, LimitedCourseStride
 from bonds import StretcherBond
 from wall import Wall
@@ -37,3 +39,35 @@ def test_limited_course_stride_progress():
 
     assert total_placed > 0
     assert strides > 0
+
+
+def test_place_next_n_batches():
+    for algo_class in (BrickByBrick, LimitedCourseStride):
+        wall = Wall(width=1830, height=600, bond=StretcherBond())
+        wall.generate_bond_design()
+        wall.assign_support_relations()
+        algo = algo_class(wall)
+
+        assert algo.place_next_n(10) == 10
+        assert algo.statistics()["total_bricks"] == 10
+
+        remaining = wall.total_bricks - 10
+        assert algo.place_next_n(sys.maxsize) == remaining
+        assert wall.complete
+        assert algo.place_next_n(10) == 0
+
+
+def test_limited_course_stride_with_direct_placement():
+    wall = Wall(width=1830, height=600, bond=StretcherBond())
+    wall.generate_bond_design()
+    wall.assign_support_relations()
+    algo = LimitedCourseStride(wall, max_courses=3, build_envelope=(800, 1300))
+    placed = 0
+    while placed <= wall.total_bricks:
+        nxt = algo.next_brick()
+        if not nxt:
+            break
+        nxt.place()
+        placed += 1
+    assert wall.complete
+    assert placed == wall.total_bricks
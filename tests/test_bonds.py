@@ -1,4 +1,8 @@
+import random
+from itertools import pairwise
+
 from bonds import FlemishBond, StretcherBond, WildBond
+from bonds.wild import _greedy_wild
 from wall import Wall
 
 
@@ -47,3 +51,23 @@ def test_wild_bond_constraints():
         lower_joints = [b.x_end for b in lower[:-1]]
         for uj in upper_joints:
             assert all(abs(uj - lj) >= 40 for lj in lower_joints)  # crude min offset
+
+
+def test_cached_design_is_not_shared():
+    first = build_and_return_stats(StretcherBond)
+    first.bricks[0].place()
+    second = build_and_return_stats(StretcherBond)
+    assert not set(map(id, first.bricks)) & set(map(id, second.bricks))
+    assert not second.bricks[0].placed
+    assert len(second.bricks[-1].supports) == len(first.bricks[-1].supports)
+
+
+def test_greedy_wild_layout():
+    placement, bricks = _greedy_wild(8, 15, random.Random(0))
+    assert sum(end - start + 1 for _, _, start, end in bricks) == 8 * 15
+    # No head joints directly above each other
+    joints = [set() for _ in placement]
+    for _, row, _, end in bricks:
+        joints[row].add(end + 1)
+    for lower, upper in pairwise(joints):
+        assert not (lower & upper) - {15}
@@ -23,3 +23,48 @@ def test_course_can_fit_multiple():
     assert course.append(HalfBrick(), 0)
     # No more room
     assert not course.can_fit(HalfBrick())
+
+
+def test_course_can_fit_multiple_counts_joints():
+    exact_width = BRICK_LENGTH * 2 + HALF_BRICK_LENGTH + HEAD_JOINT_LENGTH * 2
+    # Empty course: joints only between the added bricks
+    assert Course(width=exact_width).can_fit_multiple([Brick(), Brick(), HalfBrick()])
+    assert not Course(width=exact_width - 1).can_fit_multiple(
+        [Brick(), Brick(), HalfBrick()]
+    )
+    # Non-empty course: a joint in front of every added brick
+    for width, fits in ((exact_width, True), (exact_width - 1, False)):
+        course = Course(width=width)
+        assert course.append(Brick(), 0)
+        assert course.can_fit_multiple([Brick(), HalfBrick()]) == fits
+
+
+def test_course_tracks_placed_extent():
+    course = Course(width=BRICK_LENGTH * 2 + HEAD_JOINT_LENGTH)
+    first, second = Brick(), Brick()
+    course.append(first, 0)
+    course.append(second, 0)
+    assert not course.any_placed
+    assert not course.all_placed
+
+    second.place()
+    course.mark_placed(second)
+    assert course.any_placed
+    assert course.min_placed_x_start == second.x_start
+    assert course.max_placed_x_end == second.x_end
+    assert not course.all_placed
+
+    first.place()
+    course.mark_placed(first)
+    assert course.min_placed_x_start == 0
+    assert course.max_placed_x_end == second.x_end
+    assert course.all_placed
+
+
+def test_course_xy_arrays():
+    course = Course(width=BRICK_LENGTH + HALF_BRICK_LENGTH + HEAD_JOINT_LENGTH)
+    course.append(Brick(), 0)
+    course.append(HalfBrick(), 0)
+    x_start, x_end = course.xy_arrays()
+    assert x_start.tolist() == [brick.x_start for brick in course]
+    assert x_end.tolist() == [brick.x_end for brick in course]